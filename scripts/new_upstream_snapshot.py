@@ -37,6 +37,22 @@ QUILT_ENV = {
 }
 
 
+# Something like 23.1.1-0ubuntu1~22.04.1
+# or 23.1~1g111f1a6e-0ubuntu1
+VERSION_RE = re.compile(
+    r"(?P<major>\d+)"
+    r"\."
+    r"(?P<minor>\d+)"
+    r"((\.(?P<hotfix>\d+))|(~(?P<pre_revision>\d+)g(?P<pre_commit>\S{8})))?"
+    r"(-(?P<debian>\d+))"
+    r"(ubuntu(?P<ubuntu>\d+))"
+    r"(~(?P<series>\d+.\d+))?"
+    r"(\.(?P<series_revision>\d+))?"
+)
+# Upstream release tags are "x.y" or "x.y.z"
+UPSTREAM_TAG_RE = re.compile(r"\d+\.\d+(\.\d+)?")
+
+
 class CliError(Exception):
     pass
 
@@ -69,26 +85,11 @@ class VersionInfo:
 
     @classmethod
     def from_string(cls, version):
-        # Something like 23.1.1-0ubuntu1~22.04.1
-        # or 23.1~1g111f1a6e-0ubuntu1
-        pattern = (
-            r"(?P<major>\d+)"
-            r"\."
-            r"(?P<minor>\d+)"
-            r"((\.(?P<hotfix>\d+))|(~(?P<pre_revision>\d+)g(?P<pre_commit>\S{8})))?"  # noqa: E501
-            r"(-(?P<debian>\d+))"
-            r"(ubuntu(?P<ubuntu>\d+))"
-            r"(~(?P<series>\d+.\d+))?"
-            r"(\.(?P<series_revision>\d+))?"
-        )
-        match = re.search(
-            pattern,
-            version,
-        )
+        match = VERSION_RE.search(version)
         if not match:
             if "-" not in version and "~" not in version:
                 # It's just an upstream tag
-                return cls(*version.split("."))
+                return cls(*(int(part) for part in version.split(".")))
             raise RuntimeError(f"Cannot parse version string {version}")
         matches: dict = match.groupdict()
         for some_int in [
@@ -360,15 +361,7 @@ def is_commitish_upstream_tag(commitish):
 
     I.e., In the form of "x.y" or "x.y.z"
     """
-    parts = commitish.split(".")
-    if len(parts) not in (2, 3):
-        return False
-    for part in parts:
-        try:
-            int(part)
-        except ValueError:
-            return False
-    return True
+    return UPSTREAM_TAG_RE.fullmatch(commitish) is not None
 
 
 def format_devel_bugs_fixed(bugs_fixed):
@@ -431,9 +424,10 @@ def get_changelog_message(commitish, bug, is_upstream_tag, is_devel):
         release_text = ""
     bug_text = f" (LP: #{bug})." if bug else ""
     bugs_fixed_msg = ""
-    bugs_fixed = list(get_bugs_fixed_devel())
-    if is_devel and bugs_fixed:
-        bugs_fixed_msg = format_devel_bugs_fixed(bugs_fixed)
+    if is_devel:
+        bugs_fixed = get_bugs_fixed_devel()
+        if bugs_fixed:
+            bugs_fixed_msg = format_devel_bugs_fixed(bugs_fixed)
     return (
         "  * Upstream snapshot based on "
         f"{target}.{bug_text}{release_text}{bugs_fixed_msg}"
@@ -453,13 +447,13 @@ def get_bugs_fixed_devel():
     """Get all bugs fixed in this upstream snapshot.
 
     Search for any `LP: #` in the git log for commits between the original
-    branch HEAD and the new branch HEAD.
+    branch HEAD and the new branch HEAD. Each bug is reported once, in
+    log order.
     """
     orig_head = get_original_head()
-    commit_msgs = capture(f"git log {orig_head}..HEAD").stdout.strip()
-    for line in commit_msgs.splitlines():
-        if line.strip().startswith("LP: #"):
-            yield line.split("LP: #")[1].strip()
+    commit_msgs = capture(f"git log {orig_head}..HEAD").stdout
+    bugs = re.findall(r"^\s*LP: #(.*?)\s*$", commit_msgs, re.MULTILINE)
+    return list(dict.fromkeys(bugs))
 
 
 def get_new_version(
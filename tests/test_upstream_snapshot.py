@@ -15,6 +15,8 @@ from scripts.new_upstream_snapshot import (
     CliError,
     VersionInfo,
     capture,
+    get_changelog_message,
+    is_commitish_upstream_tag,
     new_upstream_snapshot,
     sh,
 )
@@ -349,6 +351,34 @@ def test_devel_lp_splitting(devel_setup):
     print(Path("debian/changelog").read_text())
 
 
+def test_devel_lp_deduplicated(devel_setup):
+    for i in range(2):
+        Path("newfile").write_text(f"test{i}")
+        sh(f"git add newfile && git commit -m 'fix{i}\n\nLP: #123459'")
+    sh("git checkout ubuntu/devel")
+
+    new_upstream_snapshot("main", no_sru_bug=True)
+    expected_changelog = (
+        "     - Bugs fixed in this snapshot: (LP: #123459, #123454, #123453, #123452)\n"  # noqa: E501
+        "       (LP: #123451)"
+    )
+    details = ChangelogDetails.get()
+    assert expected_changelog in details.changes
+    assert details.changes.count("#123459") == 1
+
+
+def test_sru_changelog_message_without_merge(main_setup):
+    # Only devel uploads list fixed bugs, so SRUs never look for the merge
+    message = get_changelog_message(
+        "main", bug=None, is_upstream_tag=False, is_devel=False
+    )
+    assert "Bugs fixed in this snapshot" not in message
+    with pytest.raises(CliError, match="No recent merge"):
+        get_changelog_message(
+            "main", bug=None, is_upstream_tag=False, is_devel=True
+        )
+
+
 def test_first_devel_upload(devel_setup, mock_new_sru, capsys):
     sh("git checkout ubuntu/devel")
     new_upstream_snapshot(
@@ -489,3 +519,24 @@ def test_release_instructions(devel_setup, capsys):
         pre_changelog.changes.splitlines()[1:]
         == post_changelog.changes.splitlines()[1:]
     )
+
+
+@pytest.mark.parametrize(
+    "commitish,expected",
+    [
+        ("22.1", True),
+        ("22.1.3", True),
+        ("22", False),
+        ("22.1.3.4", False),
+        ("main", False),
+        ("22.1-rc1", False),
+    ],
+)
+def test_is_commitish_upstream_tag(commitish, expected):
+    assert is_commitish_upstream_tag(commitish) is expected
+
+
+def test_version_from_upstream_tag_is_numeric():
+    version = VersionInfo.from_string("22.4.1")
+    assert (version.major, version.minor, version.hotfix) == (22, 4, 1)
+    assert version.increment_major_minor_version().major == 23